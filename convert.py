@@ -18,6 +18,7 @@ Features:
 - Handle image files (jpg, jpeg, png, gif, bmp, webp)
 - Copy NFO files
 - Two operation modes: copy to new directory or replace in place
+- Parallel conversion of files across all CPU cores
 - Detailed logging of all operations
 """
 
@@ -25,10 +26,99 @@ import os
 import subprocess
 import sys
 import shutil
+import stat
 import logging
+import logging.handlers
+import itertools
+import queue
+import threading
+import multiprocessing
+import atexit
+import functools
+import contextlib
+from collections import defaultdict
+import platform
+import types
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
 import json
 
+try:
+    import cysimdjson  # Optional SIMD JSON parser for ffprobe output
+except ImportError:
+    cysimdjson = None
+
+try:
+    import orjson  # Optional fast JSON library for the lock file
+except ImportError:
+    orjson = None
+
+try:
+    import mutagen_rs as mut  # Optional native metadata reader, avoids spawning ffprobe
+except ImportError:
+    mut = None
+
+try:
+    import av  # Optional PyAV bindings to the ffmpeg libraries, used by --daemon workers
+except ImportError:
+    av = None
+
+# Number of files passed to a single batched ffprobe invocation
+PROBE_BATCH_SIZE = 256
+
+# ffprobe command printing only the fields read by parse_probe_info, keeping the JSON to parse small
+FFPROBE_COMMAND = [
+    'ffprobe',
+    '-v', 'quiet',
+    '-print_format', 'json',
+    '-show_entries', 'format=filename,format_name:stream=codec_type,bit_rate'
+]
+
+# Number of files transcoded by a single ffmpeg process
+FFMPEG_BATCH_SIZE = 16
+
+# Number of audio files above which their stat calls are issued in parallel
+PARALLEL_STAT_THRESHOLD = 1000
+
+# Number of new lock records collected before they are appended to the lock file
+LOCK_CHECKPOINT_SIZE = 100
+
+# Commands installing ffmpeg with each supported Linux package manager, in order of preference
+PACKAGE_MANAGERS = [
+    ("apt-get", [["sudo", "apt-get", "update"], ["sudo", "apt-get", "install", "-y", "ffmpeg"]]),
+    ("dnf", [["sudo", "dnf", "install", "-y", "ffmpeg"]]),
+    ("pacman", [["sudo", "pacman", "-S", "--noconfirm", "ffmpeg"]]),
+    ("zypper", [["sudo", "zypper", "install", "-y", "ffmpeg"]]),
+]
+
+# Whether we are running inside the Windows Subsystem for Linux
+try:
+    IS_WSL = "microsoft" in platform.uname().release.lower()
+except Exception:
+    IS_WSL = False
+
+# Encoders used by PyAV for each target format
+AV_CODECS = {
+    "mp3": "libmp3lame",
+    "flac": "flac",
+    "wav": "pcm_s16le",
+    "m4a": "aac",
+    "ogg": "libvorbis",
+    "opus": "libopus",
+    "wma": "wmav2",
+    "aac": "aac",
+}
+
+# Target formats that can embed cover art, which is kept during conversion
+COVER_ART_FORMATS = frozenset({"mp3", "flac"})
+
+# Highest sample rate of PyAV encoders that accept any rate up to a limit without listing them
+AV_MAX_RATES = {"wmav2": 48000}
+
+# Extensions of files that are converted, and of files copied alongside them
+AUDIO_EXTS = frozenset({"mp3", "flac", "wav", "m4a", "ogg", "opus", "wma", "aac"})
+SIDECAR_EXTS = frozenset({"jpg", "jpeg", "png", "gif", "bmp", "webp", "nfo"})
+
 class Colors:
     """ANSI color codes for console output"""
     HEADER = '\033[95m'
@@ -47,6 +137,19 @@ def check_python_version():
         print("Python 3.6 or higher is required to run this script. Exiting.")
         sys.exit(1)
 
+@functools.lru_cache(maxsize=None)
+def cached_which(name):
+    """
+    Locate an executable on PATH, caching the result for subsequent lookups.
+
+    Args:
+        name (str): Name of the executable
+
+    Returns:
+        str: Path to the executable, or None if it is not found
+    """
+    return shutil.which(name)
+
 def check_ffmpeg():
     """
     Check if ffmpeg is installed and offer to install it if missing.
@@ -61,26 +164,21 @@ def check_ffmpeg():
     Raises:
         SystemExit: If ffmpeg installation fails or is declined
     """
-    if shutil.which("ffmpeg") is None:
+    if cached_which("ffmpeg") is None:
         choice = input("ffmpeg is not installed. Would you like to install it now? (y/n): ")
         if choice.lower() == 'y':
             # Detect OS and use appropriate package manager
-            if sys.platform.startswith('linux') or "microsoft-standard" in os.uname().release.lower():  # Linux or WSL
+            if sys.platform.startswith('linux') or IS_WSL:  # Linux or WSL
                 # Check for different package managers
-                if shutil.which("apt-get"):
-                    subprocess.run(["sudo", "apt-get", "update"])
-                    subprocess.run(["sudo", "apt-get", "install", "-y", "ffmpeg"])
-                elif shutil.which("dnf"):
-                    subprocess.run(["sudo", "dnf", "install", "-y", "ffmpeg"])
-                elif shutil.which("pacman"):
-                    subprocess.run(["sudo", "pacman", "-S", "--noconfirm", "ffmpeg"])
-                elif shutil.which("zypper"):
-                    subprocess.run(["sudo", "zypper", "install", "-y", "ffmpeg"])
+                package_manager = next((commands for name, commands in PACKAGE_MANAGERS if cached_which(name)), None)
+                if package_manager:
+                    for command in package_manager:
+                        subprocess.run(command)
                 else:
                     # Try wget as fallback
                     try:
                         print("Attempting to install ffmpeg using wget...")
-                        if not shutil.which("wget"):
+                        if not cached_which("wget"):
                             print("Installing wget first...")
                             subprocess.run(["sudo", "apt-get", "update"])
                             subprocess.run(["sudo", "apt-get", "install", "-y", "wget"])
@@ -108,14 +206,14 @@ def check_ffmpeg():
                         print("Please install ffmpeg manually.")
                         sys.exit(1)
             elif sys.platform == "darwin":
-                if shutil.which("brew"):
+                if cached_which("brew"):
                     subprocess.run(["brew", "install", "ffmpeg"])
                 else:
                     print("Homebrew not found. Please install Homebrew first:")
                     print("  /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
                     sys.exit(1)
             elif sys.platform == "win32":
-                if shutil.which("winget"):
+                if cached_which("winget"):
                     try:
                         print("Attempting to install ffmpeg using winget...")
                         subprocess.run(["winget", "install", "Gyan.FFmpeg"], check=True)
@@ -195,17 +293,43 @@ def get_user_input():
 
     return input_path, output_path, music_format, bitrate, replace_mode
 
+def parse_jobs_argument():
+    """
+    Remove the optional '--jobs N' flag from the command line arguments.
+
+    Returns:
+        int: Number of parallel conversion jobs, or None to use all CPU cores
+    """
+    if "--jobs" not in sys.argv:
+        return None
+
+    index = sys.argv.index("--jobs")
+    try:
+        jobs = int(sys.argv[index + 1])
+        if jobs < 1:
+            raise ValueError
+    except (IndexError, ValueError):
+        print("The --jobs option requires a positive integer")
+        sys.exit(1)
+    del sys.argv[index:index + 2]
+    return jobs
+
 def validate_arguments():
     """Validate and parse command line arguments or get them interactively."""
+    jobs = parse_jobs_argument()
+    daemon = "--daemon" in sys.argv
+    if daemon:
+        sys.argv.remove("--daemon")
+
     if len(sys.argv) == 1:
         # No arguments provided, get them interactively
-        return get_user_input()
+        return get_user_input() + (jobs, daemon)
     
     # Original argument validation logic
     if len(sys.argv) not in [4, 5]:
-        print("Usage: {} input_path music_format bitrate [--replace]".format(sys.argv[0]))
-        print("   or: {} input_path output_path music_format bitrate".format(sys.argv[0]))
-        return get_user_input()
+        print("Usage: {} input_path music_format bitrate [--replace] [--jobs N] [--daemon]".format(sys.argv[0]))
+        print("   or: {} input_path output_path music_format bitrate [--jobs N] [--daemon]".format(sys.argv[0]))
+        return get_user_input() + (jobs, daemon)
 
     replace_mode = "--replace" in sys.argv
     if replace_mode:
@@ -216,15 +340,15 @@ def validate_arguments():
         bitrate = sys.argv[3]
     else:
         if len(sys.argv) != 5:
-            print("Usage: {} input_path music_format bitrate [--replace]".format(sys.argv[0]))
-            print("   or: {} input_path output_path music_format bitrate".format(sys.argv[0]))
-            return get_user_input()
+            print("Usage: {} input_path music_format bitrate [--replace] [--jobs N] [--daemon]".format(sys.argv[0]))
+            print("   or: {} input_path output_path music_format bitrate [--jobs N] [--daemon]".format(sys.argv[0]))
+            return get_user_input() + (jobs, daemon)
         input_path = sys.argv[1]
         output_path = sys.argv[2]
         music_format = sys.argv[3]
         bitrate = sys.argv[4]
 
-    return input_path, output_path, music_format, bitrate, replace_mode
+    return input_path, output_path, music_format, bitrate, replace_mode, jobs, daemon
 
 def validate_paths_and_parameters(input_path, output_path, music_format, bitrate):
     """
@@ -300,29 +424,148 @@ def setup_logging(input_path):
             
             return super().format(record)
 
-    # Configure logging with UTF-8 encoding
+    # Write records from a background thread, so logging on the hot path is only a queue put
+    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')  # File handler without colors
+    file_handler.setFormatter(logging.Formatter(log_format))
+    console_handler = logging.StreamHandler(sys.stdout)  # Console handler with colors
+    console_handler.setFormatter(ColoredFormatter(log_format))
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Records are formatted by the listener's handlers, so only the message is queued
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),  # File handler without colors
-            logging.StreamHandler(sys.stdout)  # Console handler with colors
-        ]
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
 
-    # Apply colored formatter only to console handler
-    for handler in logging.getLogger().handlers:
-        if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-            handler.setFormatter(ColoredFormatter('%(asctime)s - %(levelname)s - %(message)s'))
-
     # Log initial information
     logging.info(f"{Colors.HEADER}Starting conversion process{Colors.RESET}")
     logging.info(f"Input path: {input_path}")
     return log_file
 
+def parse_probe_info(info):
+    """
+    Extract audio format and bitrate from parsed ffprobe JSON output.
+
+    Args:
+        info (dict): ffprobe output with 'format' and 'streams' sections
+
+    Returns:
+        tuple: (format_name, bitrate) or (None, None) if there is no audio stream
+    """
+    for stream in info.get('streams', []):
+        if stream.get('codec_type') == 'audio':
+            # Get format
+            format_name = info['format']['format_name'].split(',')[0]
+
+            # Get bitrate
+            bitrate = stream.get('bit_rate')
+            if bitrate:
+                bitrate = f"{int(int(bitrate)/1000)}k"
+
+            return format_name, bitrate
+    return None, None
+
+# Per-thread cysimdjson parsers, see parse_probe_output
+json_parsers = threading.local()
+
+def parse_probe_output(data):
+    """
+    Parse raw ffprobe JSON output into audio format and bitrate.
+
+    With cysimdjson available only the needed fields are read through its lazy
+    element API instead of materializing the whole document.
+
+    Args:
+        data (bytes): ffprobe stdout
+
+    Returns:
+        tuple: (format_name, bitrate) or (None, None) if there is no audio stream
+
+    Raises:
+        ValueError: If the output is not valid JSON
+    """
+    if cysimdjson is None:
+        return parse_probe_info(json.loads(data))
+
+    # A parser reuses its buffers and documents are only valid until its next parse,
+    # so every worker thread gets its own
+    json_parser = getattr(json_parsers, 'parser', None)
+    if json_parser is None:
+        json_parser = json_parsers.parser = cysimdjson.JSONParser()
+    info = json_parser.parse(data)
+    try:
+        streams = info.at_pointer('/streams')
+    except KeyError:
+        return None, None
+    for stream in streams:
+        if 'codec_type' in stream and stream['codec_type'] == 'audio':
+            format_name = info.at_pointer('/format/format_name').split(',')[0]
+            bitrate = stream['bit_rate'] if 'bit_rate' in stream else None
+            if bitrate:
+                bitrate = f"{int(int(bitrate)/1000)}k"
+            return format_name, bitrate
+    return None, None
+
+def get_native_audio_info(file_path):
+    """
+    Get audio format and bitrate information using mutagen_rs, without a subprocess.
+
+    Args:
+        file_path (str): Path to the audio file
+
+    Returns:
+        tuple: (format_name, bitrate) or (None, None) if retrieval fails
+    """
+    try:
+        tags = mut.File(file_path)
+        if tags is None or not tags.mime:
+            return None, None
+
+        # Map mime types like 'audio/mpeg' or 'audio/x-flac' to ffmpeg format names
+        format_name = tags.mime[0].split('/')[-1]
+        if format_name.startswith('x-'):
+            format_name = format_name[2:]
+        if format_name == 'mpeg':
+            format_name = 'mp3'
+
+        bitrate = tags.info.bitrate
+        return format_name, f"{bitrate // 1000}k" if bitrate else None
+    except Exception as e:
+        logging.error(f"Error getting audio info for {file_path}: {str(e)}")
+        return None, None
+
+def get_av_audio_info(file_path):
+    """
+    Get audio format and bitrate information using PyAV, without a subprocess.
+
+    Args:
+        file_path (str): Path to the audio file
+
+    Returns:
+        tuple: (format_name, bitrate) or (None, None) if retrieval fails
+    """
+    try:
+        with av.open(file_path) as container:
+            if not container.streams.audio:
+                return None, None
+            stream = container.streams.audio[0]
+            format_name = container.format.name.split(',')[0]
+            bitrate = stream.bit_rate or stream.codec_context.bit_rate
+            return format_name, f"{bitrate // 1000}k" if bitrate else None
+    except Exception as e:
+        logging.error(f"Error getting audio info for {file_path}: {str(e)}")
+        return None, None
+
 def get_audio_info(file_path):
     """
-    Get audio format and bitrate information using ffprobe.
+    Get audio format and bitrate information using mutagen_rs or PyAV if available,
+    ffprobe otherwise.
 
     Args:
         file_path (str): Path to the audio file
@@ -330,35 +573,28 @@ def get_audio_info(file_path):
     Returns:
         tuple: (format_name, bitrate) or (None, None) if retrieval fails
     """
+    if mut is not None:
+        return get_native_audio_info(file_path)
+    if av is not None:
+        return get_av_audio_info(file_path)
+
     try:
         # Handle Unicode paths by encoding properly
         encoded_path = os.fsdecode(file_path)
 
         # Add timeout to prevent hanging
-        result = subprocess.run([
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            encoded_path
-        ], capture_output=True, text=True, encoding='utf-8', timeout=10)  # Add 10 second timeout
+        result = subprocess.run(
+            FFPROBE_COMMAND + [encoded_path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10  # Add 10 second timeout
+        )
 
         if result.returncode == 0 and result.stdout:
             try:
-                info = json.loads(result.stdout)
-                for stream in info.get('streams', []):
-                    if stream.get('codec_type') == 'audio':
-                        # Get format
-                        format_name = info['format']['format_name'].split(',')[0]
-
-                        # Get bitrate
-                        bitrate = stream.get('bit_rate')
-                        if bitrate:
-                            bitrate = f"{int(int(bitrate)/1000)}k"
-
-                        return format_name, bitrate
-            except json.JSONDecodeError as e:
+                return parse_probe_output(result.stdout)
+            except ValueError as e:
                 logging.error(f"Failed to parse JSON for {file_path}: {str(e)}")
                 return None, None
         return None, None
@@ -369,71 +605,706 @@ def get_audio_info(file_path):
         logging.error(f"Error getting audio info for {file_path}: {str(e)}")
         return None, None
 
+def probe_audio_batch(file_paths):
+    """
+    Get audio format and bitrate information for many files at once.
+
+    Uses mutagen_rs or PyAV when available. Otherwise a single xargs process runs ffprobe over
+    the whole batch, so Python only spawns one subprocess per batch instead of one
+    per file. Falls back to probing files one by one where xargs is unavailable (Windows).
+
+    Args:
+        file_paths (list): Paths to the audio files
+
+    Returns:
+        list: (file_path, format_name, bitrate) tuples, with (None, None) for files that failed
+    """
+    if mut is not None or av is not None or sys.platform == "win32" or cached_which("xargs") is None:
+        return [(file_path, *get_audio_info(file_path)) for file_path in file_paths]
+
+    results = {}
+    try:
+        result = subprocess.run(
+            ['xargs', '-0', '-n', '1'] + FFPROBE_COMMAND,
+            input=b'\0'.join(os.fsencode(file_path) for file_path in file_paths),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10 * len(file_paths)
+        )
+
+        # Output is one JSON document per file; failed files produce an empty document
+        output = result.stdout.decode('utf-8', errors='replace')
+        decoder = json.JSONDecoder()
+        position = 0
+        while True:
+            while position < len(output) and output[position].isspace():
+                position += 1
+            if position >= len(output):
+                break
+            info, position = decoder.raw_decode(output, position)
+            filename = info.get('format', {}).get('filename')
+            if filename:
+                results[filename] = parse_probe_info(info)
+    except subprocess.TimeoutExpired:
+        logging.error(f"Timeout while probing batch of {len(file_paths)} files")
+    except json.JSONDecodeError as e:
+        logging.error(f"Failed to parse JSON for batch of {len(file_paths)} files: {str(e)}")
+    except Exception as e:
+        logging.error(f"Error getting audio info for batch of {len(file_paths)} files: {str(e)}")
+
+    return [(file_path, *results.get(file_path, (None, None))) for file_path in file_paths]
+
+def load_json_file(path):
+    """
+    Load a JSON file, using orjson when available.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def encode_json_line(data):
+    """
+    Serialize data as a single line of UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: JSON serializable data
+
+    Returns:
+        bytes: JSON document terminated by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b"\n"
+
+def decode_json_line(line):
+    """
+    Parse a single line of JSON, using orjson when available.
+
+    Args:
+        line (bytes): JSON document
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 def get_lock_file_path():
     """
     Get the path to the lock file, which is stored next to the script.
-    Creates the lock file if it doesn't exist.
-    
+    Creates the lock file if it doesn't exist, importing entries from the
+    legacy JSON lock file (.convert.lock) if there is one.
+
+    The lock file is append-only JSON Lines: one record per line, where later
+    records for a path override earlier ones.
+
     Returns:
         str: Path to lock file
     """
-    lock_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.convert.lock')
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    lock_file = os.path.join(script_dir, '.convert.lock.jsonl')
     if not os.path.exists(lock_file):
         try:
-            with open(lock_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f, indent=2, ensure_ascii=False)
+            legacy_lock_file = os.path.join(script_dir, '.convert.lock')
+            legacy_data = load_json_file(legacy_lock_file) if os.path.exists(legacy_lock_file) else {}
+            with open(lock_file, 'wb') as f:
+                f.writelines(encode_json_line(dict(info, path=path)) for path, info in legacy_data.items())
             logging.info(f"Created new lock file: {lock_file}")
         except Exception as e:
             logging.error(f"Failed to create lock file: {str(e)}")
     return lock_file
 
+def iter_lock_records(lock_file):
+    """
+    Stream the records of the lock file, skipping lines left incomplete by an interrupted
+    run and lines that are not conversion records.
+
+    Args:
+        lock_file (str): Path to lock file
+
+    Yields:
+        dict: Conversion info with a 'path' key
+    """
+    with open(lock_file, 'rb') as f:
+        for line in f:
+            try:
+                record = decode_json_line(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and 'path' in record:
+                yield record
+
+def compact_lock_file(lock_file):
+    """
+    Rewrite the lock file with only the latest record for each path.
+
+    Args:
+        lock_file (str): Path to lock file
+    """
+    try:
+        records = {record['path']: record for record in iter_lock_records(lock_file)}
+        temp_file = f"{lock_file}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.writelines(encode_json_line(record) for record in records.values())
+        os.replace(temp_file, lock_file)
+    except Exception as e:
+        logging.error(f"Error compacting lock file: {str(e)}")
+
 def read_lock_file(lock_file):
     """
     Read the lock file containing information about converted files.
 
+    Only the fields needed to decide whether a file can be skipped are kept, as compact
+    tuples with interned strings, so large libraries don't hold every full record in memory.
+    Compacts the file to one record per path when more than half of its records are
+    superseded by later ones.
+
     Args:
         lock_file (str): Path to lock file
 
     Returns:
-        dict: Dictionary with file paths as keys and conversion info as values
+        dict: Dictionary with file paths as keys and (format, bitrate, fingerprint) tuples
+            as values, where fingerprint is (mtime_ns, size) or None for records without one
     """
+    lock_data = {}
+    record_count = 0
     try:
-        if os.path.exists(lock_file):
-            with open(lock_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        if not os.path.exists(lock_file):
+            return lock_data
+        for record in iter_lock_records(lock_file):
+            record_count += 1
+            fingerprint = None
+            if 'mtime' in record and 'size' in record:
+                fingerprint = (record['mtime'], record['size'])
+            lock_data[record['path']] = (
+                sys.intern(str(record.get('format'))),
+                sys.intern(str(record.get('bitrate'))),
+                fingerprint
+            )
     except Exception as e:
         logging.error(f"Error reading lock file: {str(e)}")
-    return {}
+        return lock_data
+
+    if record_count > 2 * len(lock_data):
+        compact_lock_file(lock_file)
+    return lock_data
 
-def update_lock_file(lock_file, converted_files_info):
+def append_lock_records(lock_file, records):
     """
-    Update the lock file with new conversion information.
+    Append conversion records to the lock file.
 
     Args:
         lock_file (str): Path to lock file
-        converted_files_info (dict): Dictionary with conversion information to add
+        records (list): Conversion info dictionaries, each with a 'path' key
     """
     try:
-        # Read existing data
-        lock_data = read_lock_file(lock_file)
-        # Update with new data
-        lock_data.update(converted_files_info)
-        # Write back to file
-        with open(lock_file, 'w', encoding='utf-8') as f:
-            json.dump(lock_data, f, indent=2, ensure_ascii=False)
+        with open(lock_file, 'ab+', buffering=1 << 20) as f:
+            # Terminate a line cut off by an interrupted run, so it can't swallow the first record
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.writelines(encode_json_line(record) for record in records)
     except Exception as e:
         logging.error(f"Error updating lock file: {str(e)}")
 
-def process_files(input_path, output_path, music_format, bitrate, replace_mode):
+def scan_files(path, relative_dir=""):
+    """
+    Recursively yield all files below a directory using os.scandir.
+
+    Files of a directory are yielded before descending into its subdirectories,
+    matching the top-down order of os.walk. Symlinked directories are not followed.
+
+    Args:
+        path (str): Directory to scan
+        relative_dir (str): Path of the directory relative to the scan root
+
+    Yields:
+        tuple: (os.DirEntry, relative_dir) for every file
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                elif entry.is_file():
+                    yield entry, relative_dir
+    except OSError as e:
+        logging.error(f"Failed to scan directory {path}: {str(e)}")
+        return
+
+    for entry in subdirs:
+        yield from scan_files(entry.path, os.path.join(relative_dir, entry.name))
+
+def list_file_names(path):
+    """
+    List the names of the entries of a directory.
+
+    Args:
+        path (str): Directory to list
+
+    Returns:
+        set: Entry names, empty if the directory cannot be read
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError as e:
+        logging.error(f"Failed to scan directory {path}: {str(e)}")
+        return set()
+
+def stat_entry(entry):
+    """
+    Stat a directory entry, logging instead of raising if it cannot be read.
+
+    Args:
+        entry (os.DirEntry): Entry to stat
+
+    Returns:
+        os.stat_result: Result of the stat call, or None if it failed
+    """
+    try:
+        return entry.stat()
+    except OSError as e:
+        logging.error(f"Failed to stat file {entry.path}: {str(e)}")
+        return None
+
+def stat_entries(entries):
+    """
+    Stat directory entries. On large trees the calls are spread over a thread pool, so
+    their latency overlaps on slow disks and network storage instead of adding up.
+
+    Args:
+        entries (list): os.DirEntry objects
+
+    Returns:
+        list: os.stat_result for each entry, in order, or None for entries that
+            vanished or could not be read
+    """
+    if len(entries) <= PARALLEL_STAT_THRESHOLD:
+        return [stat_entry(entry) for entry in entries]
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(stat_entry, entries))
+
+def kernel_copy(src, dst, size):
+    """
+    Copy a file inside the kernel with copy_file_range, falling back to sendfile.
+
+    copy_file_range can reflink on copy-on-write filesystems such as btrfs and xfs;
+    both avoid bouncing the data through a user-space buffer.
+
+    Args:
+        src (str): Source file path
+        dst (str): Destination file path
+        size (int): Size of the source file
+
+    Returns:
+        bool: True if the file was copied, False if neither call copied all of it
+    """
+    blocksize = max(size, 1 << 23)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        for copy_chunk in (
+            lambda: os.copy_file_range(src_fd, dst_fd, blocksize),
+            lambda: os.sendfile(dst_fd, src_fd, None, blocksize),
+        ):
+            copied = 0
+            try:
+                while True:
+                    sent = copy_chunk()
+                    if sent <= 0:
+                        break
+                    copied += sent
+            except (OSError, AttributeError):
+                # Unsupported here, e.g. across filesystems or on older kernels
+                pass
+            if copied == size:
+                return True
+            # Failed or came up short, as some filesystems report 0 instead of an
+            # error (e.g. procfs, some FUSE mounts); start over with the next call
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+    return False
+
+def fast_copy(src, dst):
+    """
+    Copy a file with its permission bits and timestamps, skipping unchanged copies.
+
+    Args:
+        src (str): Source file path
+        dst (str): Destination file path
+
+    Returns:
+        bool: True if the file was copied, False if dst is src or an up-to-date copy
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+        if os.path.samestat(src_stat, dst_stat) or (
+                dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+            return False
+    except FileNotFoundError:
+        pass
+
+    if not (sys.platform.startswith('linux') and kernel_copy(src, dst, src_stat.st_size)):
+        shutil.copyfile(src, dst)
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
+
+@functools.lru_cache(maxsize=None)
+def lock_info_template(music_format, bitrate, status):
+    """
+    Get the constant part of the lock entries for one kind of result, built once per run.
+
+    Args:
+        music_format (str): Target audio format
+        bitrate (str): Target bitrate
+        status (str): Lock status, 'converted' or 'correct_format'
+
+    Returns:
+        mappingproxy: Read-only lock entry fields, without the timestamp
+    """
+    return types.MappingProxyType({'format': music_format, 'bitrate': bitrate, 'status': status})
+
+def make_result(file_path, status, music_format=None, bitrate=None, timestamp=None):
+    """
+    Build the status record returned for each processed audio file.
+
+    Args:
+        file_path (str): Path to the source audio file
+        status (str): One of 'converted', 'correct', 'skipped' or 'failed'
+        music_format (str, optional): Target audio format, stored in the lock entry
+        bitrate (str, optional): Target bitrate, stored in the lock entry
+        timestamp (str, optional): ISO timestamp stored in the lock entry. Defaults to now.
+
+    Returns:
+        dict: Status record with keys 'file_path', 'status', 'lock_info' and 'timestamp'.
+            lock_info is the shared lock_info_template, to be completed into the lock entry
+            along with the timestamp, or None if the file gets no lock entry.
+    """
+    lock_info = None
+    if status in ('converted', 'correct'):
+        lock_info = lock_info_template(music_format, bitrate, 'converted' if status == 'converted' else 'correct_format')
+        timestamp = timestamp or datetime.now().isoformat()
+    return {'file_path': file_path, 'status': status, 'lock_info': lock_info, 'timestamp': timestamp}
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_output_options(music_format, bitrate, threads):
+    """
+    Get the ffmpeg options shared by every output, built once per (format, bitrate, threads).
+
+    Args:
+        music_format (str): Target audio format
+        bitrate (str): Target bitrate
+        threads (int): Encoder threads per output, 0 lets ffmpeg decide
+
+    Returns:
+        tuple: ffmpeg output options, excluding the per-input stream mappings
+    """
+    options = [] if music_format in COVER_ART_FORMATS else ["-vn"]
+    options += ["-b:a", bitrate]
+    if music_format == "mp3":
+        options += ["-id3v2_version", "3"]
+    options += ["-threads", str(threads)]
+    return tuple(options)
+
+def ffmpeg_command(conversions, music_format, bitrate, threads=0):
+    """
+    Build the ffmpeg command line transcoding one or more files.
+
+    Every input gets its own output, so ffmpeg's startup cost is paid once per batch.
+
+    Args:
+        conversions (list): (file_path, output_file) tuples
+        music_format (str): Target audio format
+        bitrate (str): Target bitrate
+        threads (int, optional): Encoder threads per output, 0 lets ffmpeg decide
+
+    Returns:
+        list: ffmpeg arguments
+    """
+    command = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+    for file_path, _ in conversions:
+        command += ["-i", file_path]
+
+    options = ffmpeg_output_options(music_format, bitrate, threads)
+    keep_cover_art = music_format in COVER_ART_FORMATS
+    for index, (_, output_file) in enumerate(conversions):
+        command += ["-map", f"{index}:a:0", "-map_metadata", str(index)]
+        if keep_cover_art:
+            # Keep embedded cover art, as ffmpeg does by default for single inputs
+            command += ["-map", f"{index}:v:0?"]
+        command += options
+        command.append(output_file)
+    return command
+
+def run_ffmpeg(conversions, music_format, bitrate, threads=0):
+    """
+    Transcode one or more files with a single ffmpeg process.
+
+    Args:
+        conversions (list): (file_path, output_file) tuples
+        music_format (str): Target audio format
+        bitrate (str): Target bitrate
+        threads (int, optional): Encoder threads per output, 0 lets ffmpeg decide
+
+    Returns:
+        subprocess.CompletedProcess: Result of the ffmpeg run, with stderr as undecoded bytes
+    """
+    return subprocess.run(
+        ffmpeg_command(conversions, music_format, bitrate, threads),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+
+def av_sample_rate(codec_name, source_rate):
+    """
+    Pick the sample rate a PyAV encoder supports closest to the source's, preferring the
+    higher one on ties, as ffmpeg's format negotiation does for the command line path.
+
+    Args:
+        codec_name (str): Name of the audio encoder
+        source_rate (int): Sample rate of the source stream
+
+    Returns:
+        int: Sample rate to encode with
+    """
+    rates = av.Codec(codec_name, 'w').audio_rates
+    if not rates:
+        return min(source_rate, AV_MAX_RATES.get(codec_name, source_rate))
+    return min(rates, key=lambda rate: (abs(rate - source_rate), -rate))
+
+def transcode_with_av(file_path, output_file, music_format, bitrate):
+    """
+    Transcode a file with PyAV. Runs inside a long-lived --daemon worker process, so the
+    ffmpeg libraries are loaded once per worker instead of once per file.
+
+    The output matches the ffmpeg command line path: the sample rate is negotiated with the
+    encoder, and for formats in COVER_ART_FORMATS the first video stream is kept as PNG.
+
+    Args:
+        file_path (str): Path to the source audio file
+        output_file (str): Path of the file to write
+        music_format (str): Target audio format
+        bitrate (str): Target bitrate
+
+    Returns:
+        str: Error message, or None if the conversion succeeded
+    """
+    try:
+        options = {"id3v2_version": "3"} if music_format == "mp3" else {}
+        with av.open(file_path) as source, av.open(output_file, mode='w', options=options) as target:
+            source_stream = source.streams.audio[0]
+            codec_name = AV_CODECS[music_format]
+            target_stream = target.add_stream(codec_name, rate=av_sample_rate(codec_name, source_stream.rate))
+            target_stream.bit_rate = int(bitrate[:-1]) * 1000
+            target.metadata.update(source.metadata)
+
+            outputs = {source_stream.index: target_stream}  # Source stream index -> output stream
+
+            # Cover art is re-encoded to PNG, the default picture codec of the mp3 and flac muxers
+            if music_format in COVER_ART_FORMATS and source.streams.video:
+                cover = source.streams.video[0]
+                cover_stream = target.add_stream('png')
+                cover_stream.width = cover.codec_context.width
+                cover_stream.height = cover.codec_context.height
+                cover_stream.pix_fmt = 'rgb24'
+                cover_stream.disposition = cover.disposition
+                outputs[cover.index] = cover_stream
+
+            for packet in source.demux(*(source.streams[index] for index in outputs)):
+                output = outputs[packet.stream.index]
+                for frame in packet.decode():
+                    frame.pts = None
+                    if output is not target_stream:
+                        frame = frame.reformat(format='rgb24')
+                    for out_packet in output.encode(frame):
+                        target.mux(out_packet)
+            for output in outputs.values():
+                for out_packet in output.encode(None):
+                    target.mux(out_packet)
+        # PyAV only creates the output once a packet is muxed
+        if not os.path.exists(output_file):
+            return "No audio could be decoded"
+        return None
+    except Exception as e:
+        return str(e)
+
+def convert_batch(tasks, threads=0, daemon_pool=None, existing_outputs=frozenset()):
+    """
+    Convert a batch of audio files sharing one target directory. Runs inside a worker
+    thread of the conversion pool.
+
+    Files still needing conversion are transcoded by one ffmpeg process. If that fails,
+    they are retried one by one so a single broken input doesn't fail the whole batch.
+    With a daemon pool, each file is instead transcoded by a PyAV worker process, and
+    only files PyAV fails on are passed to ffmpeg.
+
+    Args:
+        tasks (list): (file_path, target_dir, music_format, bitrate, replace_mode, audio_info)
+            tuples, where audio_info is the prescanned (format_name, bitrate) or None
+        threads (int, optional): Encoder threads per ffmpeg output, 0 lets ffmpeg decide
+        daemon_pool (ProcessPoolExecutor, optional): PyAV worker processes to transcode with
+        existing_outputs (set, optional): Names already in the target directory, whose
+            conversion is skipped unless replacing
+
+    Returns:
+        list: Status records (see make_result) in the order of tasks
+    """
+    results = {}
+    pending = []  # List of (file_path, output_file, final_path)
+    target_dir, music_format, bitrate, replace_mode = tasks[0][1:5]
+
+    # Files of a batch are handled within moments of each other, so they share timestamps
+    timestamp = datetime.now().isoformat()
+
+    for file_path, _, _, _, _, audio_info in tasks:
+        # Check current format and bitrate
+        current_format, current_bitrate = audio_info or get_audio_info(file_path)
+
+        if current_format == music_format and current_bitrate == bitrate:
+            logging.info(f"Skipping file already in correct format and bitrate: {file_path}")
+            results[file_path] = make_result(file_path, 'correct', music_format, bitrate, timestamp)
+            continue
+
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        final_name = f"{stem}.{music_format}"
+        if not replace_mode and final_name in existing_outputs:
+            logging.info(f"Skipping already converted file: {file_path}")
+            results[file_path] = make_result(file_path, 'skipped')
+            continue
+
+        # Write next to the final file and publish it with an atomic os.replace, so an
+        # interrupted run never leaves a partial output or loses the original.
+        # The temp name keeps the extension ffmpeg uses to pick the output format and
+        # the full source name, which is unique per directory, so parallel workers of
+        # this process never share one.
+        output_file = os.path.join(
+            target_dir, f"{os.path.basename(file_path)}.{os.getpid()}.tmp.{music_format}")
+        pending.append((file_path, output_file, os.path.join(target_dir, final_name)))
+
+    def discard(output_file):
+        if os.path.exists(output_file):
+            os.remove(output_file)
+
+    def finish(file_path, output_file, final_path, error, timestamp):
+        if error is not None:
+            logging.error(f"Failed to convert {file_path}: {error}")
+            results[file_path] = make_result(file_path, 'failed')
+            discard(output_file)
+            return
+
+        # Publishing one file must not fail the rest of a fused batch, whose outputs
+        # are already finished and are never transcoded again
+        try:
+            os.replace(output_file, final_path)
+            if replace_mode:
+                if file_path != final_path:
+                    os.remove(file_path)
+                logging.info(f"Successfully converted and replaced: {file_path}")
+            else:
+                logging.info(f"Successfully converted: {file_path} -> {final_path}")
+            results[file_path] = make_result(file_path, 'converted', music_format, bitrate, timestamp)
+        except Exception as e:
+            logging.error(f"Error processing {file_path}: {str(e)}")
+            results[file_path] = make_result(file_path, 'failed')
+            discard(output_file)
+
+    def ffmpeg_error(result):
+        return None if result.returncode == 0 else result.stderr.decode('utf-8', errors='replace')
+
+    if daemon_pool is not None:
+        futures = [daemon_pool.submit(transcode_with_av, file_path, output_file, music_format, bitrate)
+                   for file_path, output_file, _ in pending]
+        retries = []
+        for (file_path, output_file, final_path), future in zip(pending, futures):
+            try:
+                error = future.result()
+            except Exception as e:
+                error = str(e)
+            if error is None:
+                finish(file_path, output_file, final_path, None, datetime.now().isoformat())
+            else:
+                # The ffmpeg command line handles some inputs PyAV can't; retry those with it
+                logging.warning(f"PyAV failed to convert {file_path}, retrying with ffmpeg: {error}")
+                discard(output_file)
+                retries.append((file_path, output_file, final_path))
+        pending = retries
+
+    try:
+        if len(pending) > 1:
+            result = run_ffmpeg([(file_path, output_file) for file_path, output_file, _ in pending],
+                                music_format, bitrate, threads)
+            if result.returncode == 0:
+                timestamp = datetime.now().isoformat()
+                for file_path, output_file, final_path in pending:
+                    finish(file_path, output_file, final_path, None, timestamp)
+                pending = []
+            else:
+                # Remove partial outputs before retrying each file on its own
+                for _, output_file, _ in pending:
+                    discard(output_file)
+    except Exception as e:
+        logging.error(f"Error processing batch in {target_dir}: {str(e)}")
+
+    for file_path, output_file, final_path in pending:
+        try:
+            result = run_ffmpeg([(file_path, output_file)], music_format, bitrate, threads)
+            finish(file_path, output_file, final_path, ffmpeg_error(result), datetime.now().isoformat())
+        except Exception as e:
+            logging.error(f"Error processing {file_path}: {str(e)}")
+            results[file_path] = make_result(file_path, 'failed')
+            discard(output_file)
+
+    return [results[task[0]] for task in tasks]
+
+def convert_one(file_path, target_dir, music_format, bitrate, replace_mode, audio_info=None):
+    """
+    Convert a single audio file.
+
+    Args:
+        file_path (str): Path to the source audio file
+        target_dir (str): Directory the converted file is written to
+        music_format (str): Target audio format
+        bitrate (str): Target bitrate
+        replace_mode (bool): Whether to replace the original file
+        audio_info (tuple, optional): Prescanned (format_name, bitrate), probed here if None
+
+    Returns:
+        dict: Status record (see make_result)
+    """
+    existing_outputs = frozenset() if replace_mode else list_file_names(target_dir)
+    return convert_batch([(file_path, target_dir, music_format, bitrate, replace_mode, audio_info)],
+                         existing_outputs=existing_outputs)[0]
+
+def process_files(input_path, output_path, music_format, bitrate, replace_mode, jobs=None, daemon=False):
     """
     Process all files in the input directory, converting audio files and copying others as needed.
 
+    Audio files are collected in a first pass and then converted in parallel, in batches
+    of files sharing a target directory that are transcoded by one ffmpeg process each.
+
     Args:
         input_path (str): Source directory path
         output_path (str): Destination directory path
         music_format (str): Target audio format
         bitrate (str): Target bitrate
         replace_mode (bool): Whether to replace original files
+        jobs (int, optional): Number of parallel conversions. Defaults to the CPU count.
+        daemon (bool, optional): Transcode in persistent PyAV worker processes instead of ffmpeg
 
     Returns:
         tuple: (file_count, converted_files, skipped_files, failed_files, correct_files)
@@ -448,115 +1319,173 @@ def process_files(input_path, output_path, music_format, bitrate, replace_mode):
     skipped_files = []   # List to store skipped files
     failed_files = []    # List to store failed conversions
     correct_files = []   # List to store files already in correct format/bitrate
+    tasks = []           # List of (file_path, target_dir, music_format, bitrate, replace_mode)
+    reserved_outputs = set()  # (target_dir, output name) claimed by an earlier file
+    existing_outputs = {}  # Dictionary of target_dir -> names in it, listed once per directory
+    probe_paths = []     # Audio files that may already be in the target format
+    fingerprints = {}    # Dictionary of file path -> (mtime_ns, size) of audio files
 
     # Get lock file path
     lock_file = get_lock_file_path()
     converted_files_info = read_lock_file(lock_file)
-    new_conversions = {}
+    new_conversions = []  # Lock records not yet written to the lock file
 
     def increment_count(ext):
         if ext not in file_count:
             file_count[ext] = 0
         file_count[ext] += 1
 
-    for root, _, files in os.walk(input_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            relative_path = os.path.relpath(root, input_path)
-            target_dir = root if replace_mode else os.path.join(output_path, relative_path)
+    target_dirs = {}  # Cache of relative directory -> target directory
+    audio_files = []  # List of (entry, target_dir, ext) of audio files
 
-            if not replace_mode:
+    for entry, relative_dir in scan_files(input_path):
+        file_path = entry.path
+        target_dir = target_dirs.get(relative_dir)
+        if target_dir is None:
+            if replace_mode:
+                target_dir = os.path.dirname(file_path)
+            else:
+                target_dir = os.path.join(output_path, relative_dir) if relative_dir else output_path
                 os.makedirs(target_dir, exist_ok=True)
+            target_dirs[relative_dir] = target_dir
 
-            ext = os.path.splitext(file)[1][1:].lower()
+        stem, dot, ext = entry.name.rpartition('.')
+        ext = ext.lower() if dot and stem else ""
 
-            # Process audio files
-            if ext in {"mp3", "flac", "wav", "m4a", "ogg", "opus", "wma", "aac"}:
-                # Check if file is in lock file
-                file_info = converted_files_info.get(file_path)
-                if file_info and file_info.get('format') == music_format and file_info.get('bitrate') == bitrate:
-                    logging.info(f"Skipping previously processed file (from lock): {file_path}")
-                    skipped_files.append(file_path)
-                    increment_count(ext)
-                    continue
-
-                # Check current format and bitrate
-                current_format, current_bitrate = get_audio_info(file_path)
-                
-                if current_format == music_format and current_bitrate == bitrate:
-                    logging.info(f"Skipping file already in correct format and bitrate: {file_path}")
-                    # Add to lock file info immediately
-                    current_conversion = {
-                        file_path: {
-                            'format': music_format,
-                            'bitrate': bitrate,
-                            'timestamp': datetime.now().isoformat(),
-                            'status': 'correct_format'
-                        }
-                    }
-                    update_lock_file(lock_file, current_conversion)
-                    correct_files.append(file_path)
-                    increment_count(ext)
-                    continue
-
-                if replace_mode:
-                    output_file = os.path.join(target_dir, f"{os.path.splitext(file)[0]}_temp.{music_format}")
-                else:
-                    output_file = os.path.join(target_dir, f"{os.path.splitext(file)[0]}.{music_format}")
-                    if os.path.exists(output_file):
-                        logging.info(f"Skipping already converted file: {file_path}")
-                        skipped_files.append(file_path)
-                        continue
+        # Collect audio files, checked against the lock file once they are all known
+        if ext in AUDIO_EXTS:
+            audio_files.append((entry, target_dir, ext))
 
+        # Handle image and nfo files
+        elif ext in SIDECAR_EXTS:
+            if not replace_mode:
                 try:
-                    result = subprocess.run(
-                        ["ffmpeg", "-i", file_path, "-b:a", bitrate, "-map_metadata", "0", "-id3v2_version", "3", output_file],
-                        capture_output=True,
-                        text=True
-                    )
-
-                    if result.returncode == 0:
-                        if replace_mode:
-                            os.remove(file_path)
-                            final_path = os.path.join(target_dir, f"{os.path.splitext(file)[0]}.{music_format}")
-                            os.rename(output_file, final_path)
-                            logging.info(f"Successfully converted and replaced: {file_path}")
-                        else:
-                            logging.info(f"Successfully converted: {file_path} -> {output_file}")
-
-                        # Add to lock file info
-                        new_conversions[file_path] = {
-                            'format': music_format,
-                            'bitrate': bitrate,
-                            'timestamp': datetime.now().isoformat(),
-                            'status': 'converted'
-                        }
-                        converted_files.append(file_path)
+                    if fast_copy(file_path, os.path.join(target_dir, entry.name)):
+                        logging.info(f"Copied: {file_path} -> {target_dir}")
                     else:
-                        logging.error(f"Failed to convert {file_path}: {result.stderr}")
-                        failed_files.append(file_path)
-                        continue
-
+                        logging.info(f"Skipping unchanged file: {file_path}")
+                    increment_count(ext)
                 except Exception as e:
-                    logging.error(f"Error processing {file_path}: {str(e)}")
-                    failed_files.append(file_path)
-                    continue
-
+                    logging.error(f"Failed to copy {file_path}: {str(e)}")
+
+    # Partition audio files by extension, so each decision is made once per group
+    audio_stats = stat_entries([entry for entry, _, _ in audio_files])
+    by_ext = defaultdict(list)
+    for (entry, target_dir, ext), st in zip(audio_files, audio_stats):
+        if st is not None:
+            by_ext[ext].append((entry.path, target_dir, st))
+
+    # Process audio files
+    for ext, files in by_ext.items():
+        # Only files with the target extension can already be in the target format;
+        # all others are queued for conversion without probing them
+        needs_probe = ext == music_format
+
+        for file_path, target_dir, st in files:
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            fingerprints[file_path] = fingerprint
+            output_key = (target_dir, f"{os.path.splitext(os.path.basename(file_path))[0]}.{music_format}")
+
+            # Check if file is in lock file and unchanged since it was recorded
+            lock_entry = converted_files_info.get(file_path)
+            if (lock_entry is not None and lock_entry[:2] == (music_format, bitrate)
+                    and lock_entry[2] in (None, fingerprint)):
+                logging.info(f"Skipping previously processed file (from lock): {file_path}")
+                skipped_files.append(file_path)
                 increment_count(ext)
-
-            # Handle image and nfo files
-            elif ext in {"jpg", "jpeg", "png", "gif", "bmp", "webp", "nfo"}:
-                if not replace_mode:
+                reserved_outputs.add(output_key)
+                continue
+
+            # Sources sharing a stem (song.flac, song.wav) map to the same output file;
+            # only the first one is converted so they never overwrite each other
+            if output_key in reserved_outputs:
+                logging.info(f"Skipping already converted file: {file_path}")
+                skipped_files.append(file_path)
+                continue
+            reserved_outputs.add(output_key)
+
+            # List each target directory once instead of checking each output file
+            if not replace_mode and target_dir not in existing_outputs:
+                existing_outputs[target_dir] = list_file_names(target_dir)
+
+            if needs_probe:
+                probe_paths.append(file_path)
+            tasks.append((file_path, target_dir, music_format, bitrate, replace_mode))
+
+    # Probe and convert audio files in parallel; the work runs out of process, so threads are enough
+    workers = jobs or os.cpu_count() or 1
+    # Split the cores between parallel ffmpeg processes instead of oversubscribing them
+    ffmpeg_threads = max(1, (os.cpu_count() or 1) // workers)
+    with contextlib.ExitStack() as stack:
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+
+        # Persistent PyAV workers load the ffmpeg libraries once instead of once per file
+        daemon_pool = None
+        if daemon:
+            if av is None:
+                logging.warning("PyAV is not installed, converting with ffmpeg processes instead of --daemon workers")
+            else:
+                # Workers are started while the pool and logging threads run; forking
+                # then could copy a lock held by one of them, so start from a clean process
+                start_method = "forkserver" if sys.platform.startswith('linux') else "spawn"
+                daemon_pool = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context(start_method)))
+
+        # Prescan format and bitrate of candidate audio files in batches
+        batches = [probe_paths[i:i + PROBE_BATCH_SIZE] for i in range(0, len(probe_paths), PROBE_BATCH_SIZE)]
+        audio_info = {}
+        for batch_results in executor.map(probe_audio_batch, batches):
+            for file_path, current_format, current_bitrate in batch_results:
+                audio_info[file_path] = (current_format, current_bitrate)
+
+        # Group files by target directory into batches sharing one ffmpeg process
+        tasks = [task + (audio_info.get(task[0], (None, None)),) for task in tasks]
+        tasks_by_dir = defaultdict(list)
+        for task in tasks:
+            tasks_by_dir[task[1]].append(task)
+        batches = []
+        for group in tasks_by_dir.values():
+            batches += [group[i:i + FFMPEG_BATCH_SIZE] for i in range(0, len(group), FFMPEG_BATCH_SIZE)]
+
+        batch_results = executor.map(convert_batch, batches, itertools.repeat(ffmpeg_threads),
+                                     itertools.repeat(daemon_pool),
+                                     [existing_outputs.get(batch[0][1], frozenset()) for batch in batches])
+        for result in itertools.chain.from_iterable(batch_results):
+            file_path = result['file_path']
+            status = result['status']
+            if result['lock_info']:
+                mtime, size = fingerprints[file_path]
+                if replace_mode and status == 'converted':
+                    # Fingerprint the replacement if it kept the source path
                     try:
-                        shutil.copy(file_path, target_dir)
-                        logging.info(f"Copied: {file_path} -> {target_dir}")
-                        increment_count(ext)
-                    except Exception as e:
-                        logging.error(f"Failed to copy {file_path}: {str(e)}")
+                        st = os.stat(file_path)
+                        mtime, size = st.st_mtime_ns, st.st_size
+                    except OSError:
+                        pass
+                # The only copy of the shared template, completed with the per-file fields
+                new_conversions.append(dict(result['lock_info'], timestamp=result['timestamp'],
+                                            path=file_path, mtime=mtime, size=size))
+                if len(new_conversions) >= LOCK_CHECKPOINT_SIZE:
+                    # Checkpoint progress, so an interrupted run doesn't redo finished work
+                    append_lock_records(lock_file, new_conversions)
+                    new_conversions = []
+
+            if status == 'converted':
+                converted_files.append(file_path)
+            elif status == 'correct':
+                correct_files.append(file_path)
+            elif status == 'skipped':
+                skipped_files.append(file_path)
+                continue
+            else:
+                failed_files.append(file_path)
+                continue
+
+            increment_count(file_path.rpartition('.')[2].lower())
 
     # Update lock file with new conversions
     if new_conversions:
-        update_lock_file(lock_file, new_conversions)
+        append_lock_records(lock_file, new_conversions)
 
     # Print and log summary with colors
     summary = f"\n{Colors.HEADER}Conversion Summary:{Colors.RESET}\n" + "="*50 + "\n"
@@ -592,7 +1521,7 @@ def main():
     """
     check_python_version()
     check_ffmpeg()
-    input_path, output_path, music_format, bitrate, replace_mode = validate_arguments()
+    input_path, output_path, music_format, bitrate, replace_mode, jobs, daemon = validate_arguments()
     validate_paths_and_parameters(input_path, output_path, music_format, bitrate)
 
     # Setup logging
@@ -601,10 +1530,12 @@ def main():
     logging.info(f"Format: {music_format}")
     logging.info(f"Bitrate: {bitrate}")
     logging.info(f"Replace mode: {replace_mode}")
+    logging.info(f"Parallel jobs: {jobs or os.cpu_count()}")
+    logging.info(f"Daemon workers: {daemon}")
 
     # Process files and get statistics
     file_count, converted_files, skipped_files, failed_files, correct_files = process_files(
-        input_path, output_path, music_format, bitrate, replace_mode
+        input_path, output_path, music_format, bitrate, replace_mode, jobs, daemon
     )
 
     logging.info(f"Conversion completed. Log file: {log_file}")